@@ -21,10 +21,15 @@ PACKAGES = [
     "setuptools>=68",
     "wheel",
     "numpy>=1.24",
+    "numba>=0.59",
     "mlx-whisper>=0.4.2",
     "huggingface-hub>=0.24",
+    "hf_transfer>=0.1.6",
+    "onnxruntime>=1.17",
 ]
 
+REQUIRED_MODULES = ("mlx_whisper", "numba", "numpy", "huggingface_hub", "onnxruntime")
+
 MODEL_REPOS = {
     "large-v3-turbo": "mlx-community/whisper-large-v3-turbo",
     "large-v3": "mlx-community/whisper-large-v3-mlx",
@@ -35,6 +40,85 @@ MODEL_FOLDERS = {
     "large-v3": "whisper-large-v3",
 }
 
+# Silero VAD lets the worker skip Whisper on silent audio. It is optional: the
+# worker falls back to an energy gate, so a failed fetch never blocks Ready.
+VAD_MODEL_REPO = "onnx-community/silero-vad"
+VAD_MODEL_FILE = "onnx/model.onnx"
+VAD_MODEL_FOLDER = "silero-vad"
+
+MODEL_DOWNLOAD_CONCURRENCY = 8
+VAD_PROGRESS = (0.58, 0.62)
+MODEL_PROGRESS = (0.62, 0.98)
+
+# Runs inside the venv interpreter, where huggingface_hub is installed.
+DOWNLOAD_SCRIPT = """
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from huggingface_hub import HfApi, hf_hub_download
+
+repo_id, local_dir, concurrency = sys.argv[1], sys.argv[2], int(sys.argv[3])
+requested_files = sys.argv[4:]
+# hf_hub_download stages partial files here while writing into local_dir.
+staging_dir = Path(local_dir) / ".cache" / "huggingface" / "download"
+
+
+def staged_bytes():
+    total = 0
+    for path in staging_dir.rglob("*.incomplete"):
+        try:
+            total += path.stat().st_size
+        except FileNotFoundError:
+            pass
+    return total
+
+
+async def download_all():
+    # Pin one commit so config and weights cannot come from different pushes.
+    info = HfApi().model_info(repo_id, files_metadata=True)
+    sizes = {sibling.rfilename: sibling.size or 0 for sibling in info.siblings}
+    files = requested_files or list(sizes)
+    total = max(sum(sizes.get(filename, 0) for filename in files), 1)
+    semaphore = asyncio.Semaphore(concurrency)
+    finished = 0
+    reported = 0
+
+    def report():
+        nonlocal reported
+        # A file leaves the staging dir just before it is counted as finished.
+        reported = max(reported, min(finished + staged_bytes(), total))
+        print(json.dumps({"done": reported, "total": total}), flush=True)
+
+    async def fetch(filename):
+        nonlocal finished
+        async with semaphore:
+            await asyncio.to_thread(
+                hf_hub_download,
+                repo_id=repo_id,
+                filename=filename,
+                revision=info.sha,
+                local_dir=local_dir,
+            )
+        finished += sizes.get(filename, 0)
+
+    async def report_periodically():
+        while True:
+            report()
+            await asyncio.sleep(0.5)
+
+    reporter = asyncio.create_task(report_periodically())
+    try:
+        await asyncio.gather(*(fetch(filename) for filename in files))
+    finally:
+        reporter.cancel()
+    report()
+
+
+asyncio.run(download_all())
+"""
+
 
 def emit(event_type: str, **fields: object) -> None:
     payload = {"type": event_type, **fields}
@@ -55,15 +139,33 @@ def venv_python_path(venv_dir: Path) -> Path:
     return venv_dir / "bin" / "python"
 
 
+def site_packages_path(venv_python: Path) -> Path | None:
+    return next((venv_python.parent.parent / "lib").glob("python*/site-packages"), None)
+
+
 def check_python_ready(venv_python: Path) -> tuple[bool, str]:
+    # Checks package directories instead of starting the venv interpreter;
+    # verify_python_imports does the real import once an install has run.
     if not venv_python.exists():
         return False, "python virtual environment missing"
 
+    site_packages = site_packages_path(venv_python)
+    if site_packages is None:
+        return False, "python site-packages missing"
+
+    for module in REQUIRED_MODULES:
+        if not (site_packages / module).is_dir():
+            return False, f"missing Python dependency {module}"
+
+    return True, "ready"
+
+
+def verify_python_imports(venv_python: Path) -> tuple[bool, str]:
     probe = run(
         [
             str(venv_python),
             "-c",
-            "import mlx_whisper; import numpy; import huggingface_hub",
+            "; ".join(f"import {module}" for module in REQUIRED_MODULES),
         ]
     )
     if probe.returncode != 0:
@@ -73,14 +175,26 @@ def check_python_ready(venv_python: Path) -> tuple[bool, str]:
 
 
 def check_model_ready(model_path: Path) -> tuple[bool, str]:
-    if not model_path.exists():
+    try:
+        entries = os.scandir(model_path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, "selected model is missing"
 
-    config = model_path / "config.json"
-    has_weights = any(model_path.glob("weights.*")) or any(model_path.glob("model*.safetensors"))
-    if not config.exists() or not has_weights:
-        return False, "selected model is missing"
-    return True, "ready"
+    has_config = False
+    has_weights = False
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name == "config.json":
+                has_config = True
+            elif name.startswith("weights.") or (
+                name.startswith("model") and name.endswith(".safetensors")
+            ):
+                has_weights = True
+            if has_config and has_weights:
+                return True, "ready"
+
+    return False, "selected model is missing"
 
 
 def install_venv(venv_dir: Path) -> None:
@@ -100,28 +214,126 @@ def install_packages(venv_python: Path) -> None:
             + (result.stderr.strip() or result.stdout.strip() or "unknown error")
         )
 
+    compile_site_packages(venv_python)
 
-def download_model(venv_python: Path, model_repo: str, model_path: Path, hf_home: Path) -> None:
-    emit("progress", progress=0.62, message=f"Downloading model {model_path.name}")
 
-    script = f"""
-from huggingface_hub import snapshot_download
-snapshot_download(
-    repo_id={model_repo!r},
-    local_dir={str(model_path)!r},
-)
-print("ok")
-"""
+def compile_site_packages(venv_python: Path) -> None:
+    # The worker runs with -O, which reads opt-1 bytecode that pip does not write.
+    site_packages = site_packages_path(venv_python)
+    if site_packages is None:
+        return
+
+    emit("progress", progress=0.5, message="Precompiling Python packages")
+    # Best effort: a few packages ship files for other Python versions that fail to compile.
+    run([str(venv_python), "-m", "compileall", "-q", "-j", "0", "-o", "1", str(site_packages)])
+
+
+def run_model_download(
+    command: list[str], env: dict[str, str], model_name: str, progress: tuple[float, float]
+) -> tuple[int, str]:
+    process = subprocess.Popen(
+        command,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env,
+    )
+    if process.stdout is None:
+        raise RuntimeError("model download stdout unavailable")
+
+    output: list[str] = []
+
+    for raw_line in process.stdout:
+        line = raw_line.strip()
+        try:
+            event = json.loads(line)
+            done = int(event["done"])
+            total = max(int(event["total"]), 1)
+        except (ValueError, KeyError, TypeError):
+            if line:
+                output.append(line)
+            continue
+
+        start, end = progress
+        emit(
+            "progress",
+            progress=round(start + (end - start) * done / total, 3),
+            message=(
+                f"Downloading model {model_name} "
+                f"({done / 1_000_000:.0f}/{total / 1_000_000:.0f} MB)"
+            ),
+        )
+
+    return process.wait(), "\n".join(output)
+
+
+def check_vad_ready(vad_path: Path) -> tuple[bool, str]:
+    if not (vad_path / VAD_MODEL_FILE).is_file():
+        return False, "voice activity model is missing"
+    return True, "ready"
+
+
+def ensure_vad_model(venv_python: Path, vad_path: Path, hf_home: Path) -> None:
+    vad_ready, _ = check_vad_ready(vad_path)
+    if vad_ready:
+        return
+
+    try:
+        download_model(
+            venv_python,
+            VAD_MODEL_REPO,
+            vad_path,
+            hf_home,
+            files=(VAD_MODEL_FILE,),
+            progress=VAD_PROGRESS,
+        )
+    except (OSError, RuntimeError) as exc:
+        emit(
+            "progress",
+            progress=VAD_PROGRESS[1],
+            message=f"Voice activity model unavailable, using energy gate: {exc}",
+        )
+
+
+def download_model(
+    venv_python: Path,
+    model_repo: str,
+    model_path: Path,
+    hf_home: Path,
+    files: tuple[str, ...] = (),
+    progress: tuple[float, float] = MODEL_PROGRESS,
+) -> None:
+    emit("progress", progress=progress[0], message=f"Downloading model {model_path.name}")
+
+    command = [
+        str(venv_python),
+        "-c",
+        DOWNLOAD_SCRIPT,
+        model_repo,
+        str(model_path),
+        str(MODEL_DOWNLOAD_CONCURRENCY),
+        *files,
+    ]
 
     env = dict(os.environ)
     env["HF_HOME"] = str(hf_home)
+    env["HF_HUB_DOWNLOAD_TIMEOUT"] = "60"
+    env["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
+    # hf_transfer splits large weight files into concurrent range requests.
+    env["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
 
-    result = run([str(venv_python), "-c", script], env=env)
-    if result.returncode != 0:
-        raise RuntimeError(
-            "model download failed: "
-            + (result.stderr.strip() or result.stdout.strip() or "unknown error")
+    returncode, output = run_model_download(command, env, model_path.name, progress)
+    if returncode != 0:
+        emit(
+            "progress",
+            progress=progress[0],
+            message="Retrying model download without hf_transfer",
         )
+        env.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
+        returncode, output = run_model_download(command, env, model_path.name, progress)
+
+    if returncode != 0:
+        raise RuntimeError("model download failed: " + (output or "unknown error"))
 
 
 def parse_args() -> argparse.Namespace:
@@ -145,6 +357,7 @@ def main() -> int:
     app_data_dir = Path(args.app_data_dir).expanduser().resolve()
     venv_dir = app_data_dir / "python-env"
     model_path = app_data_dir / "models" / model_folder
+    vad_path = app_data_dir / "models" / VAD_MODEL_FOLDER
     hf_home = app_data_dir / "hf-cache"
     venv_python = venv_python_path(venv_dir)
 
@@ -157,11 +370,14 @@ def main() -> int:
                 shutil.rmtree(venv_dir)
             if model_path.exists():
                 shutil.rmtree(model_path)
+            if vad_path.exists():
+                shutil.rmtree(vad_path)
 
         python_ready, python_reason = check_python_ready(venv_python)
         model_ready, _ = check_model_ready(model_path)
 
         if python_ready and model_ready:
+            ensure_vad_model(venv_python, vad_path, hf_home)
             emit("progress", progress=1.0, message=f"Model {model_id} already installed")
             emit(
                 "ready",
@@ -185,11 +401,13 @@ def main() -> int:
         if not python_ready:
             install_packages(venv_python)
 
+        ensure_vad_model(venv_python, vad_path, hf_home)
+
         model_ready, _ = check_model_ready(model_path)
         if not model_ready:
             download_model(venv_python, model_repo, model_path, hf_home)
 
-        python_ready, python_reason = check_python_ready(venv_python)
+        python_ready, python_reason = verify_python_imports(venv_python)
         model_ready, model_reason = check_model_ready(model_path)
         if not python_ready:
             raise RuntimeError(f"verification failed: {python_reason}")
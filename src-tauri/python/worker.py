@@ -8,6 +8,7 @@ chunks as JSON lines to stdout.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -16,11 +17,16 @@ import subprocess
 import sys
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from queue import SimpleQueue
+from queue import Empty, Full, Queue, SimpleQueue
 
+import mlx.core as mx
 import mlx_whisper
 import numpy as np
+import onnxruntime
+from mlx_whisper.transcribe import ModelHolder
+from numba import njit
 
 MICROPHONE_KEYWORDS = (
     "microphone",
@@ -35,10 +41,64 @@ PREFERRED_BUILTIN_MIC_KEYWORDS = ("macbook", "built-in", "internal")
 DEPRIORITIZED_MOBILE_MIC_KEYWORDS = ("iphone", "continuity", "desk view")
 APP_VIRTUAL_AUDIO_KEYWORDS = ("teams audio", "zoomaudio", "discord", "slack")
 
+_DEVICE_RE = re.compile(r"\[(\d+)\]\s+(.+)$")
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_MICROPHONE_RE = _keyword_pattern(MICROPHONE_KEYWORDS)
+_PREFERRED_BUILTIN_MIC_RE = _keyword_pattern(PREFERRED_BUILTIN_MIC_KEYWORDS)
+_DEPRIORITIZED_MOBILE_MIC_RE = _keyword_pattern(DEPRIORITIZED_MOBILE_MIC_KEYWORDS)
+_APP_VIRTUAL_AUDIO_RE = _keyword_pattern(APP_VIRTUAL_AUDIO_KEYWORDS)
+
+# Desktop audio arrives as s16le from the ScreenCaptureKit helper, mic audio as
+# f32le from ffmpeg; both are mixed straight into the float32 buffer Whisper reads.
+DESKTOP_SAMPLE_BYTES = 2
+MIC_SAMPLE_BYTES = 4
+DESKTOP_MIX_GAIN = 0.8
+MIC_MIX_GAIN = 1.35
+
+# How often a blocked chunk wait re-checks whether the capture process exited.
+PIPE_POLL_SECONDS = 0.25
+# Captured chunks buffered per pipe. When full, the reader stops draining so the
+# pipe pushes back on ffmpeg/the helper instead of audio piling up in memory.
+PIPE_QUEUE_SIZE = 3
+
+# Chunks waiting for transcription while the next one is captured.
+INFERENCE_QUEUE_SIZE = 2
+# How long a failing worker waits for an in-flight transcribe before reporting.
+INFERENCE_CANCEL_TIMEOUT_SECONDS = 2.0
+# Trailing words of the previous partial passed as the next chunk's prompt.
+PROMPT_WORDS = 6
+
+DESKTOP_MIX_SCALE = np.float32(DESKTOP_MIX_GAIN / 32768.0)
+
+# Silero VAD, installed by bootstrap.py next to the Whisper models.
+VAD_MODEL_FOLDER = "silero-vad"
+VAD_MODEL_FILE = "onnx/model.onnx"
+VAD_FRAME_SAMPLES = 512
+VAD_CONTEXT_SAMPLES = 64
+VAD_SPEECH_THRESHOLD = 0.5
+VAD_TRAILING_SILENCE_SECONDS = 0.4
+# Non-voiced frames kept ahead of an utterance: Silero's probability rises a frame
+# or so after speech starts, so this keeps the leading consonant.
+VAD_PREROLL_FRAMES = 2
+# Shorter voiced runs are almost always clicks or breaths.
+VAD_MIN_SPEECH_SECONDS = 0.25
+# Whisper hallucinates on very short inputs, so nothing shorter is transcribed.
+MIN_CHUNK_SECONDS = 0.8
+
+# Partials come from the inference thread; keep JSON lines from interleaving.
+# Reentrant so a cancel check and the emit it guards can share one critical section.
+_EMIT_LOCK = threading.RLock()
+
 
 def emit(event_type: str, **fields: object) -> None:
     payload = {"type": event_type, **fields}
-    print(json.dumps(payload), flush=True)
+    with _EMIT_LOCK:
+        print(json.dumps(payload), flush=True)
 
 
 def parse_args() -> argparse.Namespace:
@@ -58,20 +118,15 @@ def normalize_language(language: str) -> str:
     return "en"
 
 
-def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
-    lowered = text.lower()
-    return any(keyword in lowered for keyword in keywords)
-
-
+@functools.lru_cache(maxsize=1)
 def list_audio_devices() -> list[tuple[str, str]]:
     ffmpeg_bin = resolve_ffmpeg_binary()
     command = [ffmpeg_bin, "-f", "avfoundation", "-list_devices", "true", "-i", ""]
-    result = subprocess.run(command, text=True, capture_output=True, check=False)
+    result = subprocess.run(command, text=True, capture_output=True, check=False, close_fds=False)
 
     output = "\n".join([result.stdout, result.stderr])
     devices: list[tuple[str, str]] = []
 
-    regex = re.compile(r"\[(\d+)\]\s+(.+)$")
     in_audio_section = False
 
     for raw_line in output.splitlines():
@@ -86,7 +141,7 @@ def list_audio_devices() -> list[tuple[str, str]]:
         if not in_audio_section:
             continue
 
-        match = regex.search(line)
+        match = _DEVICE_RE.search(line)
         if not match:
             continue
 
@@ -128,13 +183,13 @@ def score_mic(name: str) -> int:
     lowered = name.lower()
     score = 0
 
-    if _contains_any(lowered, MICROPHONE_KEYWORDS):
+    if _MICROPHONE_RE.search(lowered):
         score += 160
-    if _contains_any(lowered, PREFERRED_BUILTIN_MIC_KEYWORDS):
+    if _PREFERRED_BUILTIN_MIC_RE.search(lowered):
         score += 35
-    if _contains_any(lowered, DEPRIORITIZED_MOBILE_MIC_KEYWORDS):
+    if _DEPRIORITIZED_MOBILE_MIC_RE.search(lowered):
         score -= 30
-    if _contains_any(lowered, APP_VIRTUAL_AUDIO_KEYWORDS):
+    if _APP_VIRTUAL_AUDIO_RE.search(lowered):
         score -= 130
 
     return score
@@ -150,6 +205,9 @@ def pick_microphone_device(devices: list[tuple[str, str]], preferred: str) -> tu
     return f":{idx}", name
 
 
+# Capture processes are spawned with close_fds=False so CPython can use posix_spawn
+# instead of fork+exec and a scan of every open fd. Python opens files and sockets
+# non-inheritable (PEP 446), so only the stdio pipes reach the child.
 def spawn_ffmpeg_mic_only(mic_input: str) -> subprocess.Popen[bytes]:
     ffmpeg_bin = resolve_ffmpeg_binary()
     command = [
@@ -168,10 +226,15 @@ def spawn_ffmpeg_mic_only(mic_input: str) -> subprocess.Popen[bytes]:
         "-ar",
         "16000",
         "-f",
-        "s16le",
+        "f32le",
         "-",
     ]
-    return subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
 
 
 def spawn_screencapturekit_helper(helper_path: str) -> subprocess.Popen[bytes]:
@@ -181,79 +244,282 @@ def spawn_screencapturekit_helper(helper_path: str) -> subprocess.Popen[bytes]:
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        close_fds=False,
     )
 
 
 def choose_optional_mic(args: argparse.Namespace) -> tuple[str | None, str | None]:
-    devices = list_audio_devices()
-    if not devices:
-        return None, None
-
     preferred_mic = args.mic_device or os.environ.get("WHISPERBAR_MIC_DEVICE", "").strip()
     if preferred_mic.lower() in {"none", "__none__"}:
         return None, None
 
+    # An explicit avfoundation index needs no device listing (and no ffmpeg probe).
+    if preferred_mic.startswith(":") or preferred_mic.isdigit():
+        explicit = resolve_device(preferred_mic, [])
+        if explicit is not None:
+            return explicit
+
+    devices = list_audio_devices()
+    if not devices:
+        return None, None
+
     mic_input, mic_name = pick_microphone_device(devices, preferred_mic)
     return mic_input, mic_name
 
 
-def mix_pcm_streams(primary: bytes, secondary: bytes | None) -> bytes:
-    first = np.frombuffer(primary, dtype=np.int16).astype(np.float32)
+def mix_pcm_streams(desktop: bytes, mic: bytes | None, out: np.ndarray) -> np.ndarray:
+    """Mix int16 desktop and float32 mic PCM into ``out``; returns the used slice."""
+    # A capture process that exits mid-sample can leave a truncated tail.
+    first = np.frombuffer(desktop, dtype=np.int16, count=len(desktop) // DESKTOP_SAMPLE_BYTES)
     second = (
-        np.frombuffer(secondary, dtype=np.int16).astype(np.float32)
-        if secondary
+        np.frombuffer(mic, dtype=np.float32, count=len(mic) // MIC_SAMPLE_BYTES)
+        if mic
         else np.empty(0, dtype=np.float32)
     )
 
-    if first.size == 0 and second.size == 0:
-        return b""
-
     target_len = int(max(first.size, second.size))
-    mixed = np.zeros(target_len, dtype=np.float32)
-    if first.size:
-        mixed[: first.size] += first * 0.8
+    mixed = out[:target_len]
+    if target_len == 0:
+        return mixed
+
+    np.multiply(first, DESKTOP_MIX_SCALE, out=mixed[: first.size], dtype=np.float32)
+    mixed[first.size :] = 0.0
     if second.size:
-        second_gain = 1.35
+        second_gain = MIC_MIX_GAIN
         if first.size:
-            first_rms = rms_level(first / 32768.0)
-            second_rms = rms_level(second / 32768.0)
+            first_rms = rms_level(first)
+            second_rms = rms_level(second)
             if first_rms > 1e-4 and second_rms > 1e-4:
                 # Keep mic intelligible when desktop audio is louder.
                 second_gain *= float(np.clip(first_rms / second_rms, 0.8, 2.2))
-        mixed[: second.size] += second * second_gain
+        _add_scaled(mixed[: second.size], second, np.float32(second_gain))
 
-    np.clip(mixed, -32768.0, 32767.0, out=mixed)
-    return mixed.astype(np.int16).tobytes()
+    np.clip(mixed, -1.0, 1.0, out=mixed)
+    return mixed
 
 
-def start_stderr_reader(process: subprocess.Popen[bytes], queue: SimpleQueue[str]) -> threading.Thread:
+def start_stderr_reader(process: subprocess.Popen[bytes], queue: SimpleQueue[bytes]) -> threading.Thread:
     def stderr_reader() -> None:
         if process.stderr is None:
             return
-        for raw in process.stderr:
-            try:
-                text = raw.decode("utf-8", errors="replace").strip()
-            except Exception:  # noqa: BLE001
-                text = str(raw)
-            if text:
-                queue.put(text)
+        # Raw blocks are only decoded if an error path drains them.
+        fd = process.stderr.fileno()
+        while True:
+            block = os.read(fd, 4096)
+            if not block:
+                return
+            queue.put(block)
 
     thread = threading.Thread(target=stderr_reader, daemon=True)
     thread.start()
     return thread
 
 
-def drain_queue(queue: SimpleQueue[str]) -> str:
-    lines: list[str] = []
+def start_pipe_reader(
+    process: subprocess.Popen[bytes], queue: Queue[bytearray], chunk_bytes: int
+) -> threading.Thread:
+    def pipe_reader() -> None:
+        if process.stdout is None:
+            return
+        fd = process.stdout.fileno()
+        while True:
+            buf = bytearray(chunk_bytes)
+            view = memoryview(buf)
+            filled = 0
+            while filled < chunk_bytes:
+                count = os.readv(fd, [view[filled:]])
+                if count == 0:
+                    break
+                filled += count
+            if filled:
+                queue.put(buf if filled == chunk_bytes else buf[:filled])
+            if filled < chunk_bytes:
+                return
+
+    thread = threading.Thread(target=pipe_reader, daemon=True)
+    thread.start()
+    return thread
+
+
+def next_pipe_chunk(process: subprocess.Popen[bytes], queue: Queue[bytearray]) -> bytearray:
+    """Wait for the next captured chunk; empty once the process has exited."""
+    while True:
+        try:
+            return queue.get(timeout=PIPE_POLL_SECONDS)
+        except Empty:
+            if process.poll() is not None:
+                return bytearray()
+
+
+def drain_queue(queue: SimpleQueue[bytes]) -> str:
+    blocks: list[bytes] = []
     while not queue.empty():
-        lines.append(queue.get())
-    return "\n".join(lines)
+        blocks.append(queue.get())
+    return b"".join(blocks).decode("utf-8", errors="replace").strip()
 
 
-def rms_level(audio: np.ndarray) -> float:
-    if audio.size == 0:
+@njit(cache=True, fastmath=True)
+def _rms(samples: np.ndarray) -> float:
+    total = 0.0
+    for i in range(samples.shape[0]):
+        value = np.float64(samples[i])
+        total += value * value
+    return (total / samples.shape[0]) ** 0.5
+
+
+@njit(cache=True, fastmath=True)
+def _add_scaled(dst: np.ndarray, src: np.ndarray, gain: np.float32) -> None:
+    for i in range(src.shape[0]):
+        dst[i] += src[i] * gain
+
+
+def rms_level(samples: np.ndarray) -> float:
+    """RMS of int16 or float32 PCM samples, on the float [0, 1] scale."""
+    if samples.size == 0:
         return 0.0
-    return float(np.sqrt(np.mean(np.square(audio), dtype=np.float64)))
+    level = float(_rms(samples))
+    if samples.dtype == np.int16:
+        level /= 32768.0
+    return level
+
+
+def warm_up_kernels() -> None:
+    # Compile each numba specialization now so the first chunk is not delayed.
+    rms_level(np.zeros(1, dtype=np.int16))
+    rms_level(np.zeros(1, dtype=np.float32))
+    _add_scaled(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32), np.float32(1.0))
+
+
+def prepare_whisper_model(model_path: Path, transcribe_kwargs: dict[str, object]) -> None:
+    # transcribe() looks models up in ModelHolder by path and dtype (fp16 by default);
+    # loading here means chunks never pay for weight loading.
+    ModelHolder.get_model(str(model_path), mx.float16)
+
+    # The first transcribe builds and compiles the Metal kernels; do it on a second
+    # of silence so that cost lands under "Loading model" instead of the first partial.
+    try:
+        mlx_whisper.transcribe(np.zeros(16000, dtype=np.float32), **transcribe_kwargs)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+class SpeechSegmenter:
+    """Streams 32 ms frames through Silero VAD and groups voiced audio into utterances.
+
+    An utterance ends after VAD_TRAILING_SILENCE_SECONDS of silence or once it
+    fills max_samples; utterances with too little speech are dropped, and short
+    ones are padded with the audio just before them up to MIN_CHUNK_SECONDS.
+    """
+
+    def __init__(self, vad_path: Path, sample_rate: int, max_samples: int) -> None:
+        options = onnxruntime.SessionOptions()
+        # One frame at a time is latency-bound; extra threads only compete with MLX.
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            str(vad_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._input = np.zeros((1, VAD_CONTEXT_SAMPLES + VAD_FRAME_SAMPLES), dtype=np.float32)
+        self._sample_rate = np.array(sample_rate, dtype=np.int64)
+        self._trailing_silence = int(sample_rate * VAD_TRAILING_SILENCE_SECONDS)
+        self._min_speech = int(sample_rate * VAD_MIN_SPEECH_SECONDS)
+        self._min_chunk = int(sample_rate * MIN_CHUNK_SECONDS)
+        self._segment = np.empty(max_samples, dtype=np.float32)
+        # Recent non-voiced frames: the tail is the pre-roll, the rest pads short utterances.
+        history_frames = max(VAD_PREROLL_FRAMES, -(-self._min_chunk // VAD_FRAME_SAMPLES))
+        self._history = np.zeros((history_frames, VAD_FRAME_SAMPLES), dtype=np.float32)
+        self._history_frames = 0
+        self._lead_frames = 0
+        self._length = 0
+        self._speech = 0
+        self._silence = 0
+        self._remainder = np.empty(0, dtype=np.float32)
+
+    def _speech_probability(self, frame: np.ndarray) -> float:
+        # The model expects the tail of the previous frame as context.
+        self._input[0, :VAD_CONTEXT_SAMPLES] = self._input[0, -VAD_CONTEXT_SAMPLES:]
+        self._input[0, VAD_CONTEXT_SAMPLES:] = frame
+        output, self._state = self._session.run(
+            None,
+            {"input": self._input, "state": self._state, "sr": self._sample_rate},
+        )
+        return float(output[0, 0])
+
+    def _push_history(self, frame: np.ndarray) -> None:
+        self._history[:-1] = self._history[1:]
+        self._history[-1] = frame
+        self._history_frames = min(self._history_frames + 1, len(self._history))
+
+    def _open_segment(self) -> None:
+        # The history is not pushed while a segment is open, so frames ahead of
+        # the pre-roll stay in place for _take to pad with.
+        preroll_frames = min(self._history_frames, VAD_PREROLL_FRAMES)
+        preroll = self._history[len(self._history) - preroll_frames :].ravel()
+        self._segment[: preroll.size] = preroll
+        self._length = preroll.size
+        self._lead_frames = self._history_frames - preroll_frames
+        self._history_frames = 0
+
+    def _take(self, segments: list[np.ndarray]) -> None:
+        if self._speech >= self._min_speech:
+            segment = self._segment[: self._length]
+            if segment.size < self._min_chunk:
+                missing = -(-(self._min_chunk - segment.size) // VAD_FRAME_SAMPLES)
+                if missing <= self._lead_frames:
+                    end = len(self._history) - VAD_PREROLL_FRAMES
+                    lead = self._history[end - missing : end].ravel()
+                    segments.append(np.concatenate((lead, segment)))
+            else:
+                segments.append(segment.copy())
+        self._length = 0
+        self._lead_frames = 0
+        self._speech = 0
+        self._silence = 0
+
+    def feed(self, pcm: np.ndarray) -> list[np.ndarray]:
+        samples = np.concatenate((self._remainder, pcm)) if self._remainder.size else pcm
+        usable = samples.size - samples.size % VAD_FRAME_SAMPLES
+        segments: list[np.ndarray] = []
+
+        for start in range(0, usable, VAD_FRAME_SAMPLES):
+            frame = samples[start : start + VAD_FRAME_SAMPLES]
+            if self._speech_probability(frame) >= VAD_SPEECH_THRESHOLD:
+                if self._length == 0:
+                    self._open_segment()
+                self._speech += VAD_FRAME_SAMPLES
+                self._silence = 0
+            elif self._length == 0:
+                self._push_history(frame)
+                continue
+            else:
+                self._silence += VAD_FRAME_SAMPLES
+                if self._silence >= self._trailing_silence:
+                    self._take(segments)
+                    self._push_history(frame)
+                    continue
+
+            if self._length + VAD_FRAME_SAMPLES > self._segment.size:
+                self._take(segments)
+            self._segment[self._length : self._length + VAD_FRAME_SAMPLES] = frame
+            self._length += VAD_FRAME_SAMPLES
+
+        self._remainder = samples[usable:].copy()
+        return segments
+
+    def flush(self) -> list[np.ndarray]:
+        segments: list[np.ndarray] = []
+        self._take(segments)
+        return segments
+
+    def reset(self) -> None:
+        """Forget stream history after audio was skipped, so it is not spliced onto new audio."""
+        self._state.fill(0.0)
+        self._input.fill(0.0)
+        self._remainder = np.empty(0, dtype=np.float32)
+        self._history_frames = 0
 
 
 def main() -> int:
@@ -290,24 +556,47 @@ def main() -> int:
 
     desktop_proc: subprocess.Popen[bytes] | None = None
     mic_proc: subprocess.Popen[bytes] | None = None
-    desktop_stderr_queue: SimpleQueue[str] | None = None
-    mic_stderr_queue: SimpleQueue[str] | None = None
+    desktop_queue: Queue[bytearray] | None = None
+    mic_queue: Queue[bytearray] | None = None
+    desktop_stderr_queue: SimpleQueue[bytes] | None = None
+    mic_stderr_queue: SimpleQueue[bytes] | None = None
+    inference_queue: Queue[np.ndarray | None] = Queue(maxsize=INFERENCE_QUEUE_SIZE)
+    inference_cancelled = threading.Event()
+    inference_thread: threading.Thread | None = None
 
     try:
-        emit("status", message="Loading model")
-
-        sample_rate = 16000
-        bytes_per_second = sample_rate * 2
-        # Slightly shorter chunks reduce missed transitions in conversational speech.
-        chunk_bytes = max(int(bytes_per_second * args.chunk_seconds), int(bytes_per_second * 1.2))
-
         helper_path = args.sck_helper_path.strip()
         if not helper_path:
             raise RuntimeError("ScreenCaptureKit helper path is missing")
         if not Path(helper_path).exists():
             raise RuntimeError(f"ScreenCaptureKit helper binary not found: {helper_path}")
 
-        mic_input, mic_name = choose_optional_mic(args)
+        transcribe_kwargs = {
+            "path_or_hf_repo": str(model_path),
+            "language": language,
+            # Lower no_speech_threshold keeps short Portuguese/English fragments.
+            "no_speech_threshold": 0.45,
+            "temperature": 0.0,
+            "condition_on_previous_text": False,
+            "word_timestamps": False,
+        }
+
+        emit("status", message="Loading model")
+        # Whisper inference runs on Metal; never fall back to the MLX CPU device.
+        mx.set_default_device(mx.gpu)
+        # The mic probe waits on an ffmpeg subprocess and MLX loads weights outside
+        # the GIL, so both overlap; numba compiles on this thread meanwhile.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            model_future = executor.submit(prepare_whisper_model, model_path, transcribe_kwargs)
+            mic_future = executor.submit(choose_optional_mic, args)
+            warm_up_kernels()
+            model_future.result()
+            mic_input, mic_name = mic_future.result()
+
+        sample_rate = 16000
+        # Slightly shorter chunks reduce missed transitions in conversational speech.
+        chunk_samples = max(int(sample_rate * args.chunk_seconds), int(sample_rate * 1.2))
+
         if mic_input and mic_name:
             emit(
                 "status",
@@ -321,6 +610,8 @@ def main() -> int:
             raise RuntimeError("ScreenCaptureKit helper stdout unavailable")
         if desktop_proc.stderr is None:
             raise RuntimeError("ScreenCaptureKit helper stderr unavailable")
+        desktop_queue = Queue(maxsize=PIPE_QUEUE_SIZE)
+        start_pipe_reader(desktop_proc, desktop_queue, chunk_samples * DESKTOP_SAMPLE_BYTES)
         desktop_stderr_queue = SimpleQueue()
         start_stderr_reader(desktop_proc, desktop_stderr_queue)
 
@@ -330,16 +621,60 @@ def main() -> int:
                 raise RuntimeError("microphone ffmpeg stdout unavailable")
             if mic_proc.stderr is None:
                 raise RuntimeError("microphone ffmpeg stderr unavailable")
+            mic_queue = Queue(maxsize=PIPE_QUEUE_SIZE)
+            start_pipe_reader(mic_proc, mic_queue, chunk_samples * MIC_SAMPLE_BYTES)
             mic_stderr_queue = SimpleQueue()
             start_stderr_reader(mic_proc, mic_stderr_queue)
 
         collected: list[str] = []
+        inference_errors: list[Exception] = []
+
+        def transcribe_chunks() -> None:
+            prompt: str | None = None
+            while True:
+                pcm = inference_queue.get()
+                if pcm is None or inference_cancelled.is_set():
+                    return
+                if inference_errors:
+                    # Keep draining so the capture loop never blocks on a full queue.
+                    continue
+                try:
+                    result = mlx_whisper.transcribe(pcm, initial_prompt=prompt, **transcribe_kwargs)
+                except Exception as exc:  # noqa: BLE001
+                    inference_errors.append(exc)
+                    stop_event.set()
+                    continue
+                chunk_text = str(result.get("text", "")).strip()
+                if chunk_text:
+                    with _EMIT_LOCK:
+                        # Never emit a partial after the main thread reported an error.
+                        if inference_cancelled.is_set():
+                            return
+                        collected.append(chunk_text)
+                        emit("partial", text=chunk_text)
+                    prompt = " ".join(chunk_text.split()[-PROMPT_WORDS:])
+
+        inference_thread = threading.Thread(target=transcribe_chunks, daemon=True)
+        inference_thread.start()
+
+        # Up to INFERENCE_QUEUE_SIZE chunks wait in the queue and one is being
+        # transcribed, so two spare buffers keep the one being filled untouched.
+        pcm_buffers = [
+            np.empty(chunk_samples, dtype=np.float32)
+            for _ in range(INFERENCE_QUEUE_SIZE + 2)
+        ]
+        pcm_index = 0
+
+        vad_path = model_path.parent / VAD_MODEL_FOLDER / VAD_MODEL_FILE
+        segmenter = (
+            SpeechSegmenter(vad_path, sample_rate, chunk_samples) if vad_path.is_file() else None
+        )
 
         while not stop_event.is_set():
-            if desktop_proc is None or desktop_proc.stdout is None:
+            if desktop_proc is None or desktop_queue is None:
                 raise RuntimeError("desktop capture process is not running")
 
-            desktop_bytes = desktop_proc.stdout.read(chunk_bytes)
+            desktop_bytes = next_pipe_chunk(desktop_proc, desktop_queue)
             if not desktop_bytes:
                 if desktop_proc.poll() is not None:
                     stderr_text = (
@@ -354,8 +689,8 @@ def main() -> int:
                 continue
 
             mic_bytes = b""
-            if mic_proc is not None and mic_proc.stdout is not None:
-                mic_chunk = mic_proc.stdout.read(chunk_bytes)
+            if mic_proc is not None and mic_queue is not None:
+                mic_chunk = next_pipe_chunk(mic_proc, mic_queue)
                 if mic_chunk:
                     mic_bytes = mic_chunk
                 elif mic_proc.poll() is not None:
@@ -372,11 +707,12 @@ def main() -> int:
                         ),
                     )
                     mic_proc = None
+                    mic_queue = None
                     mic_stderr_queue = None
 
-            pcm_bytes = mix_pcm_streams(desktop_bytes, mic_bytes)
+            pcm = mix_pcm_streams(desktop_bytes, mic_bytes, pcm_buffers[pcm_index])
 
-            if not pcm_bytes:
+            if pcm.size == 0:
                 if desktop_proc.poll() is not None:
                     stderr_text = (
                         drain_queue(desktop_stderr_queue)
@@ -389,32 +725,48 @@ def main() -> int:
                     )
                 continue
 
-            pcm = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-            if pcm.size < int(sample_rate * 0.8):
+            if pcm.size < int(sample_rate * MIN_CHUNK_SECONDS):
                 continue
             if rms_level(pcm) < 0.0006:
+                if segmenter is not None:
+                    # A silent chunk ends any utterance in progress, and the VAD
+                    # never sees it, so its stream history is stale afterwards.
+                    for segment in segmenter.flush():
+                        inference_queue.put(segment)
+                    segmenter.reset()
                 continue
 
-            result = mlx_whisper.transcribe(
-                pcm,
-                path_or_hf_repo=str(model_path),
-                language=language,
-                # Lower no_speech_threshold keeps short Portuguese/English fragments.
-                no_speech_threshold=0.45,
-                temperature=0.0,
-                condition_on_previous_text=True,
-                word_timestamps=False,
-            )
-            chunk_text = str(result.get("text", "")).strip()
-            if chunk_text:
-                collected.append(chunk_text)
-                emit("partial", text=chunk_text)
+            pcm_index = (pcm_index + 1) % len(pcm_buffers)
+
+            if segmenter is None:
+                inference_queue.put(pcm)
+                continue
+            for segment in segmenter.feed(pcm):
+                inference_queue.put(segment)
+
+        # Let chunks captured before the stop finish transcribing.
+        if segmenter is not None:
+            for segment in segmenter.flush():
+                inference_queue.put(segment)
+        inference_queue.put(None)
+        inference_thread.join()
+        if inference_errors:
+            raise inference_errors[0]
 
         final_text = "\n".join(collected).strip()
         emit("final", text=final_text)
         emit("status", message="Worker stopped")
         return 0
     except Exception as exc:  # noqa: BLE001
+        with _EMIT_LOCK:
+            inference_cancelled.set()
+        if inference_thread is not None:
+            try:
+                inference_queue.put_nowait(None)
+            except Full:
+                pass
+            # Let an in-flight transcribe finish rather than die at interpreter shutdown.
+            inference_thread.join(timeout=INFERENCE_CANCEL_TIMEOUT_SECONDS)
         emit("error", message=f"{exc}\n{traceback.format_exc()}")
         return 1
     finally:
@@ -442,7 +794,9 @@ def shutil_which(binary: str) -> str | None:
     return which(binary)
 
 
-def resolve_ffmpeg_binary(raise_if_missing: bool = True) -> str | None:
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg_binary() -> str | None:
+    # WHISPERBAR_FFMPEG_PATH and PATH do not change while the worker runs.
     explicit = os.environ.get("WHISPERBAR_FFMPEG_PATH", "").strip()
     candidates: list[str] = []
     if explicit:
@@ -464,6 +818,13 @@ def resolve_ffmpeg_binary(raise_if_missing: bool = True) -> str | None:
         path = Path(candidate)
         if path.exists() and path.is_file():
             return str(path)
+    return None
+
+
+def resolve_ffmpeg_binary(raise_if_missing: bool = True) -> str | None:
+    ffmpeg_bin = _find_ffmpeg_binary()
+    if ffmpeg_bin is not None:
+        return ffmpeg_bin
 
     if raise_if_missing:
         raise RuntimeError("ffmpeg binary not found")
@@ -75,7 +75,10 @@ pub async fn start_recording(app: &AppHandle, state: &SharedState) -> anyhow::Re
     }
 
     let mut command = Command::new(&venv_python);
+    // -O uses the opt-1 bytecode bootstrap precompiles; keep bytecode writes enabled
+    // so anything missing is cached after the first run.
     command
+        .arg("-O")
         .arg(&worker_script)
         .arg("--language")
         .arg(language)
@@ -83,7 +86,8 @@ pub async fn start_recording(app: &AppHandle, state: &SharedState) -> anyhow::Re
         .arg(&model_path)
         .stdin(Stdio::piped())
         .stdout(Stdio::piped())
-        .stderr(Stdio::piped());
+        .stderr(Stdio::piped())
+        .env_remove("PYTHONDONTWRITEBYTECODE");
 
     if let Ok(exe_path) = std::env::current_exe() {
         command.arg("--sck-helper-path").arg(exe_path);